@@ -21,6 +21,7 @@ from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 
 # Agora podemos importar componentes Django
 from django.test import TestCase
@@ -74,14 +75,27 @@ def paciente_user(db):
     )
 
 
+@pytest.fixture(scope="session")
+def endereco_template():
+    """
+    Fixture com os dados do endereço de exemplo (montados uma única vez por sessão)
+    """
+    return {
+        "logradouro": "Rua das Flores",
+        "numero": "123",
+        "bairro": "Centro",
+        "cidade": "São Paulo",
+        "estado": "SP",
+        "cep": "01234567",
+    }
+
+
 @pytest.fixture
-def endereco_sample(db):
+def endereco_sample(db, endereco_template):
     """
     Fixture que cria um endereço de exemplo
     """
-    return Endereco.objects.create(
-        logradouro="Rua das Flores", numero="123", bairro="Centro", cidade="São Paulo", estado="SP", cep="01234567"
-    )
+    return Endereco.objects.create(**endereco_template)
 
 
 @pytest.fixture
@@ -249,6 +263,14 @@ def enable_db_access_for_all_tests(db):
     pass
 
 
+@pytest.fixture(autouse=True)
+def limpar_cache():
+    """
+    Limpa o cache padrão antes de cada teste (leituras memoizadas e contadores de rate limit)
+    """
+    cache.clear()
+
+
 @pytest.fixture
 def transactional_db(db):
     """
@@ -28,6 +28,10 @@ from .serializers import (
     ConsultaUpdateSerializer,
 )
 
+# Rótulos de exibição de status e tipo, montados uma única vez por processo
+_STATUS_DISPLAY = dict(Consulta._meta.get_field("status").choices)
+_TIPO_CONSULTA_DISPLAY = dict(Consulta._meta.get_field("tipo_consulta").choices)
+
 
 class ConsultaViewSet(viewsets.ModelViewSet):
     """
@@ -43,10 +47,10 @@ class ConsultaViewSet(viewsets.ModelViewSet):
     filterset_class = ConsultaFilter
 
     # Campos para busca
-    search_fields = ["nome_paciente", "telefone_paciente", "email_paciente", "profissional__nome_social", "motivo_consulta"]
+    search_fields = ("nome_paciente", "telefone_paciente", "email_paciente", "profissional__nome_social", "motivo_consulta")
 
     # Campos para ordenação
-    ordering_fields = [
+    ordering_fields = (
         "data_hora",
         "status",
         "created_at",
@@ -54,7 +58,7 @@ class ConsultaViewSet(viewsets.ModelViewSet):
         "nome_paciente",
         "profissional__nome_social",
         "tipo_consulta",
-    ]
+    )
     ordering = ["-data_hora"]
 
     def get_serializer_class(self):
@@ -297,15 +301,13 @@ class ConsultaViewSet(viewsets.ModelViewSet):
 
         status_stats = queryset.values("status").annotate(total=Count("id"))
         for stat in status_stats:
-            status_display = dict(Consulta._meta.get_field("status").choices).get(stat["status"], stat["status"])
+            status_display = _STATUS_DISPLAY.get(stat["status"], stat["status"])
             stats["por_status"][status_display] = stat["total"]
 
         # Estatísticas por tipo
         tipo_stats = queryset.values("tipo_consulta").annotate(total=Count("id"))
         for stat in tipo_stats:
-            tipo_display = dict(Consulta._meta.get_field("tipo_consulta").choices).get(
-                stat["tipo_consulta"], stat["tipo_consulta"]
-            )
+            tipo_display = _TIPO_CONSULTA_DISPLAY.get(stat["tipo_consulta"], stat["tipo_consulta"])
             stats["por_tipo"][tipo_display] = stat["total"]
 
         # Receita do mês
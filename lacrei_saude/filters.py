@@ -0,0 +1,28 @@
+"""
+Backends de filtro personalizados para Lacrei Saúde API
+=======================================================
+"""
+
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class LazyDjangoFilterBackend(DjangoFilterBackend):
+    """
+    DjangoFilterBackend que só instancia o FilterSet quando algum filtro
+    declarado recebe valor na query string
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        """
+        Retorna o queryset original quando não há filtros preenchidos
+        """
+        filterset_class = self.get_filterset_class(view, queryset)
+        if filterset_class is None:
+            return queryset
+
+        # Ignora parâmetros alheios ao FilterSet (page, search, ordering) e valores vazios
+        query_params = request.query_params
+        if not any(query_params.get(name) for name in filterset_class.base_filters):
+            return queryset
+
+        return super().filter_queryset(request, queryset, view)
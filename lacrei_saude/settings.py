@@ -256,7 +256,8 @@ SIMPLE_JWT = {
 RATELIMIT_ENABLE = True
 RATELIMIT_USE_CACHE = "default"
 
-# Cache para rate limiting (em produção usar Redis)
+# Cache para rate limiting e leituras memoizadas (em produção usar Redis: o LocMemCache é por processo,
+# então contadores e invalidações não são compartilhados entre workers)
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
@@ -8,8 +8,10 @@ import os
 from .settings import *
 
 # Database para testes - usar PostgreSQL se disponível, senão SQLite
+# FAST_TESTS=1 força SQLite em memória mesmo com DATABASE_URL (sem fsync por commit)
 DATABASE_URL = os.getenv("DATABASE_URL")
-if DATABASE_URL and "postgresql" in DATABASE_URL:
+FAST_TESTS = os.getenv("FAST_TESTS") == "1"
+if DATABASE_URL and "postgresql" in DATABASE_URL and not FAST_TESTS:
     # Usar PostgreSQL no CI
     DATABASES = {
         "default": {
@@ -30,8 +32,17 @@ else:
         }
     }
 
-# Manter migrações habilitadas para garantir que as tabelas sejam criadas
-# MIGRATION_MODULES = {} # Comentado para permitir migrações
+
+# Criar o schema de testes direto dos models, sem executar a cadeia de migrações
+class DisableMigrations:
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
 
 # Email backend para testes
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
@@ -423,10 +423,10 @@ class TestDataIntegrity(TestCase):
         url = reverse("profissionais:profissional-list")
 
         duplicate_data = {
-            "nome_social": "Dr. Segundo",
+            "nome_social": "Doutor Segundo",
             "profissao": "MEDICO",
             "email": "unico@test.com",  # Email já existe
-            "telefone": "11888777666",
+            "telefone": "11987654322",
             "endereco": {
                 "logradouro": "Outra Rua",
                 "numero": "200",
@@ -0,0 +1,85 @@
+"""
+Testes para Backends de Filtro - Lacrei Saúde API
+=================================================
+"""
+
+from unittest import mock
+
+import pytest
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from django.test import TestCase
+
+from lacrei_saude.filters import LazyDjangoFilterBackend
+from profissionais.filters import ProfissionalFilter
+from profissionais.models import Endereco, Profissional
+from profissionais.views import ProfissionalViewSet
+
+
+@pytest.mark.unit
+class TestLazyDjangoFilterBackend(TestCase):
+    """
+    Testes para LazyDjangoFilterBackend
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Profissionais compartilhados entre os testes da classe (criados uma única vez)
+        """
+        endereco = Endereco.objects.create(
+            logradouro="Rua Teste", numero="100", bairro="Centro", cidade="São Paulo", estado="SP", cep="12345678"
+        )
+        Profissional.objects.create(
+            nome_social="Dr. Médico", profissao="MEDICO", email="medico@test.com", telefone="11987654321", endereco=endereco
+        )
+        Profissional.objects.create(
+            nome_social="Dra. Psicóloga",
+            profissao="PSICOLOGO",
+            email="psi@test.com",
+            telefone="11987654322",
+            endereco=endereco,
+        )
+
+    def setUp(self):
+        """
+        Configuração inicial para os testes
+        """
+        self.factory = APIRequestFactory()
+        self.backend = LazyDjangoFilterBackend()
+        self.view = ProfissionalViewSet()
+        self.queryset = Profissional.objects.all()
+
+    def _filtrar(self, params):
+        request = Request(self.factory.get("/", params))
+        return self.backend.filter_queryset(request, self.queryset, self.view)
+
+    def test_sem_parametros_nao_instancia_filterset(self):
+        """
+        Testa que o FilterSet não é instanciado sem parâmetros de filtro
+        """
+        with mock.patch.object(ProfissionalFilter, "__init__") as filterset_init:
+            resultado = self._filtrar({"page": "1", "search": "Dr", "ordering": "nome_social"})
+
+        filterset_init.assert_not_called()
+        self.assertIs(resultado, self.queryset)
+
+    def test_parametros_vazios_nao_instancia_filterset(self):
+        """
+        Testa que filtros com valor vazio são ignorados
+        """
+        with mock.patch.object(ProfissionalFilter, "__init__") as filterset_init:
+            resultado = self._filtrar({"profissao": "", "cidade": ""})
+
+        filterset_init.assert_not_called()
+        self.assertIs(resultado, self.queryset)
+
+    def test_parametro_preenchido_aplica_filtro(self):
+        """
+        Testa que filtros preenchidos continuam sendo aplicados
+        """
+        resultado = self._filtrar({"profissao": "PSICOLOGO"})
+
+        self.assertEqual(resultado.count(), 1)
+        self.assertEqual(resultado.get().profissao, "PSICOLOGO")
@@ -9,76 +9,11 @@ import re
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+# Padrões e tabelas usados a cada validação, montados uma única vez por processo
+_NAO_DIGITOS_RE = re.compile(r"[^0-9]")
 
-def sanitize_string(value):
-    """
-    Sanitiza strings removendo caracteres perigosos
-    """
-    if not isinstance(value, str):
-        return value
-
-    # Remove HTML tags
-    value = html.escape(value)
-
-    # Remove caracteres perigosos
-    dangerous_chars = ["<", ">", '"', "'", "&", ";", "(", ")", "{", "}"]
-    for char in dangerous_chars:
-        if char in value and char not in ["&lt;", "&gt;", "&quot;", "&#x27;", "&amp;"]:
-            value = value.replace(char, "")
-
-    # Remove múltiplos espaços
-    value = re.sub(r"\s+", " ", value).strip()
-
-    return value
-
-
-def validate_cpf(cpf):
-    """
-    Valida CPF brasileiro
-    """
-    # Remove caracteres não numéricos
-    cpf = re.sub(r"[^0-9]", "", str(cpf))
-
-    # Verifica se tem 11 dígitos
-    if len(cpf) != 11:
-        raise ValidationError(_("CPF deve ter 11 dígitos"))
-
-    # Verifica se não são todos iguais
-    if cpf == cpf[0] * 11:
-        raise ValidationError(_("CPF inválido"))
-
-    # Validação do primeiro dígito
-    soma = sum(int(cpf[i]) * (10 - i) for i in range(9))
-    resto = soma % 11
-    digito1 = 0 if resto < 2 else 11 - resto
-
-    if int(cpf[9]) != digito1:
-        raise ValidationError(_("CPF inválido"))
-
-    # Validação do segundo dígito
-    soma = sum(int(cpf[i]) * (11 - i) for i in range(10))
-    resto = soma % 11
-    digito2 = 0 if resto < 2 else 11 - resto
-
-    if int(cpf[10]) != digito2:
-        raise ValidationError(_("CPF inválido"))
-
-    return cpf
-
-
-def validate_phone(phone):
-    """
-    Valida telefone brasileiro
-    """
-    # Remove caracteres não numéricos
-    phone = re.sub(r"[^0-9]", "", str(phone))
-
-    # Verifica se tem 10 ou 11 dígitos
-    if len(phone) not in [10, 11]:
-        raise ValidationError(_("Telefone deve ter 10 ou 11 dígitos"))
-
-    # Verifica se começa com código de área válido
-    if phone[:2] not in [
+_DDDS_VALIDOS = frozenset(
+    {
         "11",
         "12",
         "13",
@@ -146,7 +81,79 @@ def validate_phone(phone):
         "97",
         "98",
         "99",
-    ]:
+    }
+)
+
+
+def sanitize_string(value):
+    """
+    Sanitiza strings removendo caracteres perigosos
+    """
+    if not isinstance(value, str):
+        return value
+
+    # Remove HTML tags
+    value = html.escape(value)
+
+    # Remove caracteres perigosos
+    dangerous_chars = ["<", ">", '"', "'", "&", ";", "(", ")", "{", "}"]
+    for char in dangerous_chars:
+        if char in value and char not in ["&lt;", "&gt;", "&quot;", "&#x27;", "&amp;"]:
+            value = value.replace(char, "")
+
+    # Remove múltiplos espaços
+    value = re.sub(r"\s+", " ", value).strip()
+
+    return value
+
+
+def validate_cpf(cpf):
+    """
+    Valida CPF brasileiro
+    """
+    # Remove caracteres não numéricos
+    cpf = _NAO_DIGITOS_RE.sub("", str(cpf))
+
+    # Verifica se tem 11 dígitos
+    if len(cpf) != 11:
+        raise ValidationError(_("CPF deve ter 11 dígitos"))
+
+    # Verifica se não são todos iguais
+    if cpf == cpf[0] * 11:
+        raise ValidationError(_("CPF inválido"))
+
+    # Validação do primeiro dígito
+    soma = sum(int(cpf[i]) * (10 - i) for i in range(9))
+    resto = soma % 11
+    digito1 = 0 if resto < 2 else 11 - resto
+
+    if int(cpf[9]) != digito1:
+        raise ValidationError(_("CPF inválido"))
+
+    # Validação do segundo dígito
+    soma = sum(int(cpf[i]) * (11 - i) for i in range(10))
+    resto = soma % 11
+    digito2 = 0 if resto < 2 else 11 - resto
+
+    if int(cpf[10]) != digito2:
+        raise ValidationError(_("CPF inválido"))
+
+    return cpf
+
+
+def validate_phone(phone):
+    """
+    Valida telefone brasileiro
+    """
+    # Remove caracteres não numéricos
+    phone = _NAO_DIGITOS_RE.sub("", str(phone))
+
+    # Verifica se tem 10 ou 11 dígitos
+    if len(phone) not in [10, 11]:
+        raise ValidationError(_("Telefone deve ter 10 ou 11 dígitos"))
+
+    # Verifica se começa com código de área válido
+    if phone[:2] not in _DDDS_VALIDOS:
         raise ValidationError(_("Código de área inválido"))
 
     return phone
@@ -157,7 +164,7 @@ def validate_cep(cep):
     Valida CEP brasileiro
     """
     # Remove caracteres não numéricos
-    cep = re.sub(r"[^0-9]", "", str(cep))
+    cep = _NAO_DIGITOS_RE.sub("", str(cep))
 
     if len(cep) != 8:
         raise ValidationError(_("CEP deve ter 8 dígitos"))
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-15 23:22
+
+import django.core.validators
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profissionais', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profissional',
+            name='email',
+            field=models.EmailField(help_text='Email profissional', max_length=254, validators=[django.core.validators.EmailValidator()]),
+        ),
+        migrations.AddConstraint(
+            model_name='profissional',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='profissional_email_ci_unique'),
+        ),
+    ]
@@ -6,6 +6,7 @@ Modelos para Profissionais da Saúde - Lacrei Saúde API
 from django.core.exceptions import ValidationError
 from django.core.validators import EmailValidator, RegexValidator
 from django.db import models
+from django.db.models.functions import Lower
 
 from lacrei_saude.models import BaseModelWithManager
 
@@ -121,7 +122,7 @@ class Profissional(BaseModelWithManager):
     especialidade = models.CharField(max_length=100, blank=True, help_text="Especialização ou área específica")
 
     # Contato
-    email = models.EmailField(unique=True, validators=[EmailValidator()], help_text="Email profissional")
+    email = models.EmailField(validators=[EmailValidator()], help_text="Email profissional")
     telefone = models.CharField(
         max_length=20,
         validators=[
@@ -163,6 +164,10 @@ class Profissional(BaseModelWithManager):
             models.Index(fields=["nome_social"]),
             models.Index(fields=["email"]),
         ]
+        constraints = [
+            # Unicidade case-insensitive resolvida pelo índice do banco
+            models.UniqueConstraint(Lower("email"), name="profissional_email_ci_unique"),
+        ]
 
     def __str__(self):
         return f"{self.nome_social} - {self.get_profissao_display()}"
@@ -178,10 +183,6 @@ class Profissional(BaseModelWithManager):
         if self.whatsapp:
             self.whatsapp = self._normalizar_telefone(self.whatsapp)
 
-        # Email em lowercase
-        if self.email:
-            self.email = self.email.lower()
-
         # Validar registro profissional
         if self.registro_profissional:
             self._validar_registro_profissional()
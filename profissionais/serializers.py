@@ -6,6 +6,8 @@ Serializers para Profissionais - Lacrei Saúde API
 from rest_framework import serializers
 
 from django.core.validators import EmailValidator
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 
 from lacrei_saude.serializers import BaseModelSerializer, TimestampsMixin, ValidationMixin
 from lacrei_saude.validators import (
@@ -21,6 +23,9 @@ from lacrei_saude.validators import (
 
 from .models import Endereco, Profissional
 
+# Siglas de UF aceitas, montadas uma única vez por processo
+_ESTADOS_VALIDOS = frozenset(choice[0] for choice in Endereco._meta.get_field("estado").choices)
+
 
 class EnderecoSerializer(BaseModelSerializer, TimestampsMixin, ValidationMixin):
     """
@@ -89,8 +94,7 @@ class EnderecoSerializer(BaseModelSerializer, TimestampsMixin, ValidationMixin):
     def validate(self, data):
         """Validações gerais do endereço"""
         # Validar se o estado existe
-        estados_validos = [choice[0] for choice in Endereco._meta.get_field("estado").choices]
-        if data.get("estado") and data["estado"] not in estados_validos:
+        if data.get("estado") and data["estado"] not in _ESTADOS_VALIDOS:
             raise serializers.ValidationError({"estado": "Estado inválido"})
 
         return data
@@ -208,18 +212,10 @@ class ProfissionalSerializer(BaseModelSerializer, TimestampsMixin, ValidationMix
         return value
 
     def validate_email(self, value):
-        """Validação de email único"""
+        """Validação de email (unicidade garantida pela constraint do banco)"""
         if value:
             value = sanitize_email(value)
 
-            # Verificar se email já existe (excluindo o próprio registro na edição)
-            queryset = Profissional.objects.filter(email=value, is_active=True)
-            if self.instance:
-                queryset = queryset.exclude(pk=self.instance.pk)
-
-            if queryset.exists():
-                raise serializers.ValidationError("Já existe um profissional ativo com este email")
-
         return value
 
     def validate_telefone(self, value):
@@ -238,11 +234,21 @@ class ProfissionalSerializer(BaseModelSerializer, TimestampsMixin, ValidationMix
             raise serializers.ValidationError("Valor da consulta não pode ser negativo")
         return value
 
+    def _raise_email_duplicado(self, error):
+        """Traduz violação da constraint única de email em erro de validação"""
+        if "email" in str(error):
+            raise serializers.ValidationError({"email": "Já existe um profissional com este email"})
+        raise error
+
     def create(self, validated_data):
         """Criar profissional com endereço aninhado"""
         endereco_data = validated_data.pop("endereco")
-        endereco = Endereco.objects.create(**endereco_data)
-        profissional = Profissional.objects.create(endereco=endereco, **validated_data)
+        try:
+            with transaction.atomic():
+                endereco = Endereco.objects.create(**endereco_data)
+                profissional = Profissional.objects.create(endereco=endereco, **validated_data)
+        except IntegrityError as e:
+            self._raise_email_duplicado(e)
         return profissional
 
     def update(self, instance, validated_data):
@@ -253,13 +259,17 @@ class ProfissionalSerializer(BaseModelSerializer, TimestampsMixin, ValidationMix
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
 
-        # Atualizar dados do endereço se fornecidos
-        if endereco_data:
-            endereco_serializer = EnderecoSerializer(instance.endereco, data=endereco_data, partial=True)
-            if endereco_serializer.is_valid(raise_exception=True):
-                endereco_serializer.save()
-
-        instance.save()
+        try:
+            with transaction.atomic():
+                # Atualizar dados do endereço se fornecidos
+                if endereco_data:
+                    endereco_serializer = EnderecoSerializer(instance.endereco, data=endereco_data, partial=True)
+                    if endereco_serializer.is_valid(raise_exception=True):
+                        endereco_serializer.save()
+
+                instance.save()
+        except IntegrityError as e:
+            self._raise_email_duplicado(e)
         return instance
 
 
@@ -328,10 +338,6 @@ class ProfissionalDetailSerializer(ProfissionalSerializer):
 
     def get_consultas_mes_atual(self, obj):
         """Retorna consultas do mês atual"""
-        import datetime
-
-        from django.utils import timezone
-
         hoje = timezone.now().date()
         primeiro_dia_mes = hoje.replace(day=1)
 
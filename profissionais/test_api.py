@@ -3,7 +3,9 @@ Testes de API para Profissionais - Lacrei Saúde API
 ===================================================
 """
 
+from datetime import timedelta
 from decimal import Decimal
+from unittest import mock
 
 import pytest
 from rest_framework import status
@@ -11,113 +13,303 @@ from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
 
+from consultas.models import Consulta
 from profissionais.models import Endereco, Profissional
+from tests.factories import ProfissionalPayloadFactory
 
 User = get_user_model()
 
+# Biografia próxima do limite, montada uma única vez por módulo
+_LARGE_BIO = "A" * 1900
+
+
+class ProfissionalAPITestCase(TestCase):
+    """
+    Base dos testes de API: cliente DRF e cache limpo a cada teste (a listagem é memoizada)
+    """
+
+    client_class = APIClient
+
+    def setUp(self):
+        """
+        Limpa o cache padrão, independente do runner (pytest ou manage.py test)
+        """
+        super().setUp()
+        cache.clear()
+
 
-@pytest.mark.django_db
 @pytest.mark.views
-class TestProfissionalAPIAuthenticated(TestCase):
+class TestProfissionalAPIAuthenticated(ProfissionalAPITestCase):
     """
     Testes para API de Profissionais com autenticação
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Configuração inicial para os testes
+        Dados compartilhados entre os testes da classe (criados uma única vez)
         """
         # Criar usuário administrador
-        self.admin_user = User.objects.create_user(
+        cls.admin_user = User.objects.create_user(
             username="admin@test.com", email="admin@test.com", password="admin123", user_type="ADMIN", is_staff=True
         )
 
         # Criar usuário paciente
-        self.paciente_user = User.objects.create_user(
+        cls.paciente_user = User.objects.create_user(
             username="paciente@test.com", email="paciente@test.com", password="paciente123", user_type="PACIENTE"
         )
 
-        # Cliente da API
-        self.client = APIClient()
+        # Token JWT real, usado apenas no teste do fluxo de autenticação
+        cls.admin_token = str(RefreshToken.for_user(cls.admin_user).access_token)
 
         # Criar endereço
-        self.endereco = Endereco.objects.create(
+        cls.endereco = Endereco.objects.create(
             logradouro="Rua das Flores", numero="123", bairro="Centro", cidade="São Paulo", estado="SP", cep="01234567"
         )
 
         # Criar profissional existente
-        self.profissional = Profissional.objects.create(
+        cls.profissional = Profissional.objects.create(
             nome_social="Dr. João Silva",
             profissao="MEDICO",
             email="joao@test.com",
             telefone="11987654321",
-            endereco=self.endereco,
+            endereco=cls.endereco,
             valor_consulta=Decimal("150.00"),
         )
 
         # Dados para criar novo profissional
-        self.profissional_data = {
-            "nome_social": "Dra. Maria Santos",
-            "profissao": "PSICOLOGO",
-            "email": "maria@test.com",
-            "telefone": "11888777666",
-            "endereco": {
-                "logradouro": "Avenida Paulista",
-                "numero": "1000",
-                "bairro": "Bela Vista",
-                "cidade": "São Paulo",
-                "estado": "SP",
-                "cep": "98765432",
-            },
-            "valor_consulta": "120.00",
-        }
-
-    def get_jwt_token(self, user):
-        """
-        Gera token JWT para o usuário
-        """
-        refresh = RefreshToken.for_user(user)
-        return str(refresh.access_token)
+        cls.profissional_data = ProfissionalPayloadFactory(
+            nome_social="Dra. Maria Santos",
+            profissao="PSICOLOGO",
+            email="maria@test.com",
+            telefone="11888777666",
+            valor_consulta="120.00",
+        )
+
+        # URLs resolvidas uma única vez por classe
+        cls.list_url = reverse("profissionais:profissional-list")
+        cls.detail_url = reverse("profissionais:profissional-detail", kwargs={"pk": cls.profissional.pk})
 
     def authenticate_admin(self):
         """
         Autentica como administrador
         """
-        token = self.get_jwt_token(self.admin_user)
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.client.force_authenticate(user=self.admin_user)
 
     def authenticate_paciente(self):
         """
         Autentica como paciente
         """
-        token = self.get_jwt_token(self.paciente_user)
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.client.force_authenticate(user=self.paciente_user)
+
+    def test_list_profissionais_jwt_token(self):
+        """
+        Testa listagem autenticando com token JWT real no header
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.admin_token}")
+
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
 
     def test_list_profissionais_authenticated(self):
         """
         Testa listagem de profissionais com autenticação
         """
         self.authenticate_admin()
-        url = reverse("profissionais:profissional-list")
 
-        response = self.client.get(url)
+        response = self.client.get(self.list_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn("results", response.data)
         self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(response.data["results"][0]["nome_social"], "Dr. João Silva")
 
+    def test_list_profissionais_query_count_constante(self):
+        """
+        Testa que a listagem não faz uma query de endereço por profissional (N+1)
+        """
+        self.authenticate_admin()
+
+        for i in range(3):
+            endereco = Endereco.objects.create(
+                logradouro=f"Rua {i}", numero="10", bairro="Centro", cidade="São Paulo", estado="SP", cep="01234567"
+            )
+            Profissional.objects.create(
+                nome_social=f"Dr. Extra {i}",
+                profissao="MEDICO",
+                email=f"extra{i}@test.com",
+                telefone="11987654321",
+                endereco=endereco,
+            )
+
+        # COUNT da paginação e SELECT com JOIN em endereço, apenas com as colunas da listagem
+        with self.assertNumQueries(2) as queries:
+            response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["cidade_atendimento"], "São Paulo/SP")
+        self.assertNotIn("biografia", queries.captured_queries[-1]["sql"])
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.list_url, {"cidade": "São Paulo"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_profissionais_cache_invalidado_na_escrita(self):
+        """
+        Testa que a listagem é memoizada com Cache-Control privado e descartada após uma escrita
+        """
+        self.authenticate_admin()
+
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertIn("max-age=60", response["Cache-Control"])
+        self.assertIn("Authorization", response["Vary"])
+
+        # Segunda chamada servida pelo cache
+        with self.assertNumQueries(0):
+            response = self.client.get(self.list_url)
+        self.assertEqual(response.data["count"], 1)
+
+        # Outro host não reaproveita a página memoizada (links de paginação são absolutos)
+        with self.assertNumQueries(2):
+            response = self.client.get(self.list_url, HTTP_HOST="localhost")
+        self.assertEqual(response.data["count"], 1)
+
+        response = self.client.delete(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertNotIn("Cache-Control", response)
+
+        response = self.client.get(self.list_url)
+        self.assertEqual(response.data["count"], 0)
+
+    def test_retrieve_profissional_reflete_novas_consultas(self):
+        """
+        Testa que o detalhe não é memoizado: contadores de consultas refletem escritas fora desta view
+        """
+        self.authenticate_admin()
+
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_consultas"], 0)
+        self.assertIn("private", response["Cache-Control"])
+
+        Consulta.objects.create(
+            profissional=self.profissional,
+            data_hora=timezone.now() + timedelta(days=1),
+            nome_paciente="Paciente",
+            telefone_paciente="11999888777",
+        )
+
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.data["total_consultas"], 1)
+
+    def test_consultas_profissional_query_count_constante(self):
+        """
+        Testa que a listagem de consultas reaproveita o profissional já carregado (sem N+1)
+        """
+        self.authenticate_admin()
+
+        for dias in range(1, 4):
+            Consulta.objects.create(
+                profissional=self.profissional,
+                data_hora=timezone.now() + timedelta(days=dias),
+                nome_paciente=f"Paciente {dias}",
+                telefone_paciente="11999888777",
+            )
+
+        url = reverse("profissionais:profissional-consultas", kwargs={"pk": self.profissional.pk})
+
+        # SELECT do profissional com JOIN em endereço e SELECT das consultas
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(response.data[0]["profissional_nome"], "Dr. João Silva")
+
+    def test_agenda_profissional_sem_count_extra(self):
+        """
+        Testa que o total da agenda vem das consultas já carregadas, sem SELECT COUNT adicional
+        """
+        self.authenticate_admin()
+
+        data_hora = timezone.now() + timedelta(days=1)
+        Consulta.objects.create(
+            profissional=self.profissional, data_hora=data_hora, nome_paciente="Paciente", telefone_paciente="11999888777"
+        )
+
+        url = reverse("profissionais:profissional-agenda", kwargs={"pk": self.profissional.pk})
+        data = timezone.localdate(data_hora).isoformat()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {"data": data})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/json")
+        resultado = response.json()
+        self.assertEqual(resultado["profissional"], "Dr. João Silva")
+        self.assertEqual(resultado["total_consultas"], 1)
+        self.assertEqual(resultado["consultas_agendadas"][0]["nome_paciente"], "Paciente")
+
+    def test_agenda_profissional_data_invalida(self):
+        """
+        Testa que a agenda exige data no formato YYYY-MM-DD
+        """
+        self.authenticate_admin()
+        url = reverse("profissionais:profissional-agenda", kwargs={"pk": self.profissional.pk})
+
+        for data in ["15/01/2030", "2030-02-30", "amanha"]:
+            with self.subTest(data=data):
+                response = self.client.get(url, {"data": data})
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn("error", response.data)
+
+    def test_desativar_profissional_com_consultas_futuras(self):
+        """
+        Testa que a desativação é bloqueada por consultas futuras usando um único COUNT limitado
+        """
+        self.authenticate_admin()
+
+        for dias in range(1, 3):
+            Consulta.objects.create(
+                profissional=self.profissional,
+                data_hora=timezone.now() + timedelta(days=dias),
+                nome_paciente=f"Paciente {dias}",
+                telefone_paciente="11999888777",
+            )
+
+        url = reverse("profissionais:profissional-desativar", kwargs={"pk": self.profissional.pk})
+
+        with self.assertNumQueries(2):
+            response = self.client.post(url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["consultas_futuras"], 2)
+
+        # Acima do limite, o total é informado de forma aproximada
+        with mock.patch("profissionais.views._LIMITE_CONSULTAS_FUTURAS", 1):
+            response = self.client.post(url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["consultas_futuras"], "1+")
+
     def test_retrieve_profissional_authenticated(self):
         """
         Testa buscar profissional específico
         """
         self.authenticate_admin()
-        url = reverse("profissionais:profissional-detail", kwargs={"pk": self.profissional.pk})
 
-        response = self.client.get(url)
+        response = self.client.get(self.detail_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["nome_social"], "Dr. João Silva")
@@ -129,58 +321,46 @@ class TestProfissionalAPIAuthenticated(TestCase):
         Testa criação de profissional como admin
         """
         self.authenticate_admin()
-        url = reverse("profissionais:profissional-list")
 
-        response = self.client.post(url, self.profissional_data, format="json")
+        response = self.client.post(self.list_url, self.profissional_data, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data["nome_social"], "Dra. Maria Santos")
         self.assertEqual(response.data["profissao"], "PSICOLOGO")
 
-        # Verificar se foi criado no banco
-        self.assertTrue(Profissional.objects.filter(email="maria@test.com").exists())
-
     def test_update_profissional_admin(self):
         """
         Testa atualização de profissional como admin
         """
         self.authenticate_admin()
-        url = reverse("profissionais:profissional-detail", kwargs={"pk": self.profissional.pk})
 
         update_data = {"nome_social": "Dr. João Silva Atualizado", "especialidade": "Cardiologia Avançada"}
 
-        response = self.client.patch(url, update_data, format="json")
+        response = self.client.patch(self.detail_url, update_data, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["nome_social"], "Dr. João Silva Atualizado")
 
-        # Verificar se foi atualizado no banco
-        self.profissional.refresh_from_db()
-        self.assertEqual(self.profissional.nome_social, "Dr. João Silva Atualizado")
-
     def test_delete_profissional_admin(self):
         """
         Testa exclusão (soft delete) de profissional como admin
         """
         self.authenticate_admin()
-        url = reverse("profissionais:profissional-detail", kwargs={"pk": self.profissional.pk})
 
-        response = self.client.delete(url)
+        response = self.client.delete(self.detail_url)
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
         # Verificar soft delete
-        self.profissional.refresh_from_db()
-        self.assertFalse(self.profissional.is_active)
+        self.assertTrue(Profissional.objects.filter(pk=self.profissional.pk, is_active=False).exists())
 
     def test_create_profissional_paciente_forbidden(self):
         """
         Testa que paciente não pode criar profissional
         """
         self.authenticate_paciente()
-        url = reverse("profissionais:profissional-list")
 
-        response = self.client.post(url, self.profissional_data, format="json")
+        response = self.client.post(self.list_url, self.profissional_data, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
@@ -189,11 +369,10 @@ class TestProfissionalAPIAuthenticated(TestCase):
         Testa que paciente não pode atualizar profissional
         """
         self.authenticate_paciente()
-        url = reverse("profissionais:profissional-detail", kwargs={"pk": self.profissional.pk})
 
         update_data = {"nome_social": "Tentativa de alteração"}
 
-        response = self.client.patch(url, update_data, format="json")
+        response = self.client.patch(self.detail_url, update_data, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
@@ -202,9 +381,8 @@ class TestProfissionalAPIAuthenticated(TestCase):
         Testa que paciente pode listar profissionais (somente leitura)
         """
         self.authenticate_paciente()
-        url = reverse("profissionais:profissional-list")
 
-        response = self.client.get(url)
+        response = self.client.get(self.list_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn("results", response.data)
@@ -214,249 +392,187 @@ class TestProfissionalAPIAuthenticated(TestCase):
         Testa busca de profissional por profissão
         """
         self.authenticate_admin()
-        url = reverse("profissionais:profissional-list")
 
         # Buscar médicos
-        response = self.client.get(url, {"profissao": "MEDICO"})
+        response = self.client.get(self.list_url, {"profissao": "MEDICO"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["count"], 1)
         self.assertEqual(response.data["results"][0]["profissao"], "MEDICO")
 
         # Buscar psicólogos (não deve retornar nada)
-        response = self.client.get(url, {"profissao": "PSICOLOGO"})
+        response = self.client.get(self.list_url, {"profissao": "PSICOLOGO"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data["results"]), 0)
+        self.assertEqual(response.data["count"], 0)
 
     def test_search_profissional_by_cidade(self):
         """
         Testa busca de profissional por cidade
         """
         self.authenticate_admin()
-        url = reverse("profissionais:profissional-list")
 
-        response = self.client.get(url, {"cidade": "São Paulo"})
+        response = self.client.get(self.list_url, {"cidade": "São Paulo"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["count"], 1)
+
+    def test_estatisticas_profissionais(self):
+        """
+        Testa estatísticas calculadas em duas queries e memoizadas no cache
+        """
+        self.authenticate_admin()
+        url = reverse("profissionais:profissional-estatisticas")
+
+        # Agregação geral e agrupamento por profissão
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_profissionais"], 1)
+        self.assertEqual(response.data["profissionais_ativos"], 1)
+        self.assertEqual(response.data["valor_medio_consulta"], Decimal("150.00"))
+        self.assertEqual(response.data["por_profissao"]["Médico(a)"]["total"], 1)
+
+        # Segunda chamada servida pelo cache
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.data["total_profissionais"], 1)
 
 
-@pytest.mark.django_db
 @pytest.mark.views
-class TestProfissionalAPIUnauthenticated(TestCase):
+class TestProfissionalAPIUnauthenticated(ProfissionalAPITestCase):
     """
     Testes para API de Profissionais sem autenticação
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Configuração inicial para os testes
+        Dados compartilhados entre os testes da classe (criados uma única vez)
         """
-        self.client = APIClient()
-
         # Criar endereço e profissional
-        self.endereco = Endereco.objects.create(
+        cls.endereco = Endereco.objects.create(
             logradouro="Rua das Flores", numero="123", bairro="Centro", cidade="São Paulo", estado="SP", cep="01234567"
         )
 
-        self.profissional = Profissional.objects.create(
+        cls.profissional = Profissional.objects.create(
             nome_social="Dr. João Silva",
             profissao="MEDICO",
             email="joao@test.com",
             telefone="11987654321",
-            endereco=self.endereco,
+            endereco=cls.endereco,
             valor_consulta=Decimal("150.00"),
         )
 
-    def test_list_profissionais_unauthenticated(self):
-        """
-        Testa que listagem requer autenticação
-        """
-        url = reverse("profissionais:profissional-list")
-
-        response = self.client.get(url)
+        # URLs resolvidas uma única vez por classe
+        cls.list_url = reverse("profissionais:profissional-list")
+        cls.detail_url = reverse("profissionais:profissional-detail", kwargs={"pk": cls.profissional.pk})
 
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
-    def test_create_profissional_unauthenticated(self):
+    def test_endpoints_unauthenticated(self):
         """
-        Testa que criação requer autenticação
+        Testa que listagem, criação e detalhes requerem autenticação
         """
-        url = reverse("profissionais:profissional-list")
-
-        profissional_data = {
-            "nome_social": "Dr. Teste",
-            "profissao": "MEDICO",
-            "email": "teste@test.com",
-            "telefone": "11999888777",
-        }
+        profissional_data = ProfissionalPayloadFactory()
 
-        response = self.client.post(url, profissional_data, format="json")
+        casos = [
+            ("list", lambda: self.client.get(self.list_url)),
+            ("create", lambda: self.client.post(self.list_url, profissional_data, format="json")),
+            ("retrieve", lambda: self.client.get(self.detail_url)),
+        ]
 
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        for acao, requisicao in casos:
+            with self.subTest(acao=acao):
+                response = requisicao()
 
-    def test_retrieve_profissional_unauthenticated(self):
-        """
-        Testa que buscar detalhes requer autenticação
-        """
-        url = reverse("profissionais:profissional-detail", kwargs={"pk": self.profissional.pk})
-
-        response = self.client.get(url)
-
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+                self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
-@pytest.mark.django_db
 @pytest.mark.views
-class TestProfissionalAPIValidation(TestCase):
+class TestProfissionalAPIValidation(ProfissionalAPITestCase):
     """
     Testes de validação para API de Profissionais
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Configuração inicial para os testes
+        Dados compartilhados entre os testes da classe (criados uma única vez)
         """
         # Criar usuário admin
-        self.admin_user = User.objects.create_user(
+        cls.admin_user = User.objects.create_user(
             username="admin@test.com", email="admin@test.com", password="admin123", user_type="ADMIN", is_staff=True
         )
 
-        self.client = APIClient()
-
-        # Autenticar
-        refresh = RefreshToken.for_user(self.admin_user)
-        token = str(refresh.access_token)
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
-
-    def test_create_profissional_invalid_email(self):
-        """
-        Testa criação com email inválido
-        """
-        url = reverse("profissionais:profissional-list")
-
-        invalid_data = {
-            "nome_social": "Dr. Teste",
-            "profissao": "MEDICO",
-            "email": "email_invalido",
-            "telefone": "11987654321",
-            "endereco": {
-                "logradouro": "Rua Teste",
-                "numero": "100",
-                "bairro": "Teste",
-                "cidade": "São Paulo",
-                "estado": "SP",
-                "cep": "12345678",
-            },
-        }
+        # Profissional já cadastrado (email duplicado e atualização inválida)
+        cls.shared_endereco = Endereco.objects.create(
+            logradouro="Rua Teste", numero="100", bairro="Teste", cidade="São Paulo", estado="SP", cep="12345678"
+        )
 
-        response = self.client.post(url, invalid_data, format="json")
+        cls.existing_profissional = Profissional.objects.create(
+            nome_social="Dr. Primeiro",
+            profissao="MEDICO",
+            email="teste@test.com",
+            telefone="11987654321",
+            endereco=cls.shared_endereco,
+        )
 
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn("email", response.data)
+        # URLs resolvidas uma única vez por classe
+        cls.list_url = reverse("profissionais:profissional-list")
+        cls.detail_url = reverse("profissionais:profissional-detail", kwargs={"pk": cls.existing_profissional.pk})
 
-    def test_create_profissional_missing_required_fields(self):
+    def setUp(self):
         """
-        Testa criação sem campos obrigatórios
+        Configuração por teste
         """
-        url = reverse("profissionais:profissional-list")
-
-        incomplete_data = {
-            "nome_social": "Dr. Teste",
-            # Faltando profissao, email, telefone, endereco
-        }
-
-        response = self.client.post(url, incomplete_data, format="json")
-
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-        # Verificar se campos obrigatórios estão sendo validados
-        required_fields = ["profissao", "email", "telefone", "endereco"]
-        for field in required_fields:
-            if field in response.data:
-                self.assertIn(field, response.data)
+        super().setUp()
+        # Autenticar
+        self.client.force_authenticate(user=self.admin_user)
 
-    def test_create_profissional_invalid_profissao(self):
+    def test_create_profissional_dados_invalidos(self):
         """
-        Testa criação com profissão inválida
+        Testa que a criação com dados inválidos retorna 400 apontando o campo com erro
         """
-        url = reverse("profissionais:profissional-list")
-
-        invalid_data = {
-            "nome_social": "Dr. Teste",
-            "profissao": "PROFISSAO_INEXISTENTE",
-            "email": "teste@test.com",
-            "telefone": "11987654321",
-            "endereco": {
-                "logradouro": "Rua Teste",
-                "numero": "100",
-                "bairro": "Teste",
-                "cidade": "São Paulo",
-                "estado": "SP",
-                "cep": "12345678",
-            },
-        }
+        casos = [
+            ("email_invalido", ProfissionalPayloadFactory(email="email_invalido"), "email"),
+            ("campos_obrigatorios", {"nome_social": "Dr. Teste"}, "profissao"),
+            ("profissao_invalida", ProfissionalPayloadFactory(profissao="PROFISSAO_INEXISTENTE"), "profissao"),
+            ("email_duplicado", ProfissionalPayloadFactory(email=self.existing_profissional.email), "email"),
+        ]
 
-        response = self.client.post(url, invalid_data, format="json")
+        for caso, payload, campo_invalido in casos:
+            with self.subTest(caso=caso):
+                response = self.client.post(self.list_url, payload, format="json")
 
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn("profissao", response.data)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn(campo_invalido, response.data)
 
-    def test_create_profissional_duplicate_email(self):
+    def test_create_profissional_email_duplicado_case_insensitive(self):
         """
-        Testa criação com email duplicado
+        Testa que um email já cadastrado com outra caixa retorna 400 no campo email
         """
-        # Criar primeiro profissional
-        endereco = Endereco.objects.create(
-            logradouro="Rua Teste", numero="100", bairro="Teste", cidade="São Paulo", estado="SP", cep="12345678"
-        )
-
         Profissional.objects.create(
-            nome_social="Dr. Primeiro", profissao="MEDICO", email="teste@test.com", telefone="11987654321", endereco=endereco
+            nome_social="Doutora Caixa",
+            profissao="MEDICO",
+            email="Joao.Silva@Email.com",
+            telefone="11987654321",
+            endereco=self.shared_endereco,
         )
+        total_antes = Profissional.objects.count()
 
-        # Tentar criar segundo com mesmo email
-        url = reverse("profissionais:profissional-list")
-
-        duplicate_data = {
-            "nome_social": "Dr. Segundo",
-            "profissao": "MEDICO",
-            "email": "teste@test.com",  # Email duplicado
-            "telefone": "11888777666",
-            "endereco": {
-                "logradouro": "Outra Rua",
-                "numero": "200",
-                "bairro": "Outro Bairro",
-                "cidade": "São Paulo",
-                "estado": "SP",
-                "cep": "87654321",
-            },
-        }
-
-        response = self.client.post(url, duplicate_data, format="json")
+        response = self.client.post(self.list_url, ProfissionalPayloadFactory(email="joao.silva@email.com"), format="json")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn("email", response.data)
+        self.assertEqual(response.data["email"], "Já existe um profissional com este email")
+        self.assertEqual(Profissional.objects.count(), total_antes)
 
     def test_update_profissional_invalid_data(self):
         """
         Testa atualização com dados inválidos
         """
-        # Criar profissional
-        endereco = Endereco.objects.create(
-            logradouro="Rua Teste", numero="100", bairro="Teste", cidade="São Paulo", estado="SP", cep="12345678"
-        )
-
-        profissional = Profissional.objects.create(
-            nome_social="Dr. Teste", profissao="MEDICO", email="teste@test.com", telefone="11987654321", endereco=endereco
-        )
-
-        url = reverse("profissionais:profissional-detail", kwargs={"pk": profissional.pk})
-
         invalid_update = {"valor_consulta": "-50.00"}  # Valor negativo
 
-        response = self.client.patch(url, invalid_update, format="json")
+        response = self.client.patch(self.detail_url, invalid_update, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("valor_consulta", response.data)
@@ -472,28 +588,32 @@ class TestProfissionalAPIValidation(TestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
-@pytest.mark.django_db
 @pytest.mark.views
-class TestProfissionalAPIEdgeCases(TestCase):
+class TestProfissionalAPIEdgeCases(ProfissionalAPITestCase):
     """
     Testes de casos extremos para API de Profissionais
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Configuração inicial para os testes
+        Dados compartilhados entre os testes da classe (criados uma única vez)
         """
         # Criar usuário admin
-        self.admin_user = User.objects.create_user(
+        cls.admin_user = User.objects.create_user(
             username="admin@test.com", email="admin@test.com", password="admin123", user_type="ADMIN", is_staff=True
         )
 
-        self.client = APIClient()
+        # URL resolvida uma única vez por classe
+        cls.list_url = reverse("profissionais:profissional-list")
 
+    def setUp(self):
+        """
+        Configuração por teste
+        """
+        super().setUp()
         # Autenticar
-        refresh = RefreshToken.for_user(self.admin_user)
-        token = str(refresh.access_token)
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.client.force_authenticate(user=self.admin_user)
 
     def test_pagination_profissionais(self):
         """
@@ -504,19 +624,21 @@ class TestProfissionalAPIEdgeCases(TestCase):
             logradouro="Rua Teste", numero="100", bairro="Teste", cidade="São Paulo", estado="SP", cep="12345678"
         )
 
-        for i in range(15):
-            Profissional.objects.create(
-                nome_social=f"Dr. Teste {i+1}",
-                profissao="MEDICO",
-                email=f"teste{i+1}@test.com",
-                telefone=f"1199999999{i}",
-                endereco=endereco,
-            )
-
-        url = reverse("profissionais:profissional-list")
+        Profissional.objects.bulk_create(
+            [
+                Profissional(
+                    nome_social=f"Dr. Teste {i+1}",
+                    profissao="MEDICO",
+                    email=f"teste{i+1}@test.com",
+                    telefone=f"1199999999{i}",
+                    endereco=endereco,
+                )
+                for i in range(15)
+            ]
+        )
 
         # Primeira página
-        response = self.client.get(url)
+        response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn("results", response.data)
         self.assertIn("next", response.data)
@@ -560,37 +682,54 @@ class TestProfissionalAPIEdgeCases(TestCase):
             endereco=endereco_rj,
         )
 
-        url = reverse("profissionais:profissional-list")
-
         # Filtrar médicos em São Paulo
-        response = self.client.get(url, {"profissao": "MEDICO", "cidade": "São Paulo"})
+        response = self.client.get(self.list_url, {"profissao": "MEDICO", "cidade": "São Paulo"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["count"], 1)
         self.assertEqual(response.data["results"][0]["nome_social"], "Dr. Médico SP")
 
+    def test_filter_profissionais_valor_max(self):
+        """
+        Testa filtro de get_queryset por valor máximo (sem valor definido também entra) e valor inválido ignorado
+        """
+        url = reverse("profissionais:profissional-estatisticas")
+        endereco = Endereco.objects.create(
+            logradouro="Rua Teste", numero="100", bairro="Teste", cidade="São Paulo", estado="SP", cep="12345678"
+        )
+        valores = {"Dr. Barato": Decimal("100.00"), "Dr. Caro": Decimal("300.00"), "Dr. Sem Valor": None}
+        Profissional.objects.bulk_create(
+            [
+                Profissional(
+                    nome_social=nome,
+                    profissao="MEDICO",
+                    email=f"valor{i}@test.com",
+                    telefone="11987654321",
+                    endereco=endereco,
+                    valor_consulta=valor,
+                )
+                for i, (nome, valor) in enumerate(valores.items())
+            ]
+        )
+
+        # estatisticas usa get_queryset() sem o FilterSet, isolando o filtro da view
+        response = self.client.get(url, {"valor_max": "150", "disponivel": "true"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_profissionais"], 2)
+
+        response = self.client.get(url, {"valor_max": "abc"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_profissionais"], 3)
+
     def test_create_profissional_with_minimal_data(self):
         """
         Testa criação com dados mínimos obrigatórios
         """
-        url = reverse("profissionais:profissional-list")
-
-        minimal_data = {
-            "nome_social": "Dr. Mínimo",
-            "profissao": "MEDICO",
-            "email": "minimo@test.com",
-            "telefone": "11987654321",
-            "endereco": {
-                "logradouro": "Rua Mínima",
-                "numero": "1",
-                "bairro": "Mínimo",
-                "cidade": "São Paulo",
-                "estado": "SP",
-                "cep": "12345678",
-            },
-        }
-
-        response = self.client.post(url, minimal_data, format="json")
+        minimal_data = ProfissionalPayloadFactory(nome_social="Dr. Mínimo")
+
+        response = self.client.post(self.list_url, minimal_data, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data["nome_social"], "Dr. Mínimo")
@@ -599,25 +738,9 @@ class TestProfissionalAPIEdgeCases(TestCase):
         """
         Testa criação com payload grande (biografia longa)
         """
-        url = reverse("profissionais:profissional-list")
-
-        large_data = {
-            "nome_social": "Dr. Biografia Longa",
-            "profissao": "MEDICO",
-            "email": "longo@test.com",
-            "telefone": "11987654321",
-            "biografia": "A" * 1900,  # Biografia próxima do limite
-            "endereco": {
-                "logradouro": "Rua Longa",
-                "numero": "999",
-                "bairro": "Longo",
-                "cidade": "São Paulo",
-                "estado": "SP",
-                "cep": "12345678",
-            },
-        }
-
-        response = self.client.post(url, large_data, format="json")
+        large_data = ProfissionalPayloadFactory(nome_social="Dr. Biografia Longa", biografia=_LARGE_BIO)
+
+        response = self.client.post(self.list_url, large_data, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(len(response.data["biografia"]), 1900)
+        self.assertEqual(len(response.data["biografia"]), len(_LARGE_BIO))
@@ -4,41 +4,57 @@ Testes para Modelos de Profissionais - Lacrei Saúde API
 """
 
 from decimal import Decimal
+from types import MappingProxyType
 
 import pytest
 
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 
 from profissionais.models import Endereco, Profissional
 
+# Dados base imutáveis compartilhados pelo módulo (sobrescrever campos com {**DEFAULTS, ...})
+ENDERECO_DEFAULTS = MappingProxyType(
+    {
+        "logradouro": "Rua das Flores",
+        "numero": "123",
+        "bairro": "Centro",
+        "cidade": "São Paulo",
+        "estado": "SP",
+        "cep": "01234567",
+    }
+)
+VALOR_CONSULTA_DEFAULT = Decimal("150.00")
+VALOR_CONSULTA_COM_DESCONTO = Decimal("135.00")  # VALOR_CONSULTA_DEFAULT com 10% de desconto
+# Endereço fica de fora: cada teste informa uma instância (salva ou não)
+PROFISSIONAL_DEFAULTS = MappingProxyType(
+    {
+        "nome_social": "Dr. João Silva",
+        "nome_registro": "João Silva Santos",
+        "profissao": "MEDICO",
+        "registro_profissional": "CRM123456",
+        "especialidade": "Cardiologia",
+        "email": "joao.silva@email.com",
+        "telefone": "11987654321",
+        "biografia": "Médico especialista em cardiologia com 10 anos de experiência.",
+        "aceita_convenio": True,
+        "valor_consulta": VALOR_CONSULTA_DEFAULT,
+    }
+)
+
 
-@pytest.mark.django_db
 @pytest.mark.models
 class TestEnderecoModel(TestCase):
     """
     Testes para o modelo Endereco
     """
 
-    def setUp(self):
-        """
-        Configuração inicial para os testes
-        """
-        self.endereco_data = {
-            "logradouro": "Rua das Flores",
-            "numero": "123",
-            "bairro": "Centro",
-            "cidade": "São Paulo",
-            "estado": "SP",
-            "cep": "01234567",
-        }
-
     def test_criar_endereco_valido(self):
         """
         Testa criação de endereço com dados válidos
         """
-        endereco = Endereco.objects.create(**self.endereco_data)
+        endereco = Endereco.objects.create(**ENDERECO_DEFAULTS)
 
         self.assertEqual(endereco.logradouro, "Rua das Flores")
         self.assertEqual(endereco.numero, "123")
@@ -53,7 +69,7 @@ class TestEnderecoModel(TestCase):
         """
         Testa a propriedade endereco_completo
         """
-        endereco = Endereco.objects.create(**self.endereco_data)
+        endereco = Endereco.objects.create(**ENDERECO_DEFAULTS)
         endereco_esperado = "Rua das Flores, 123 - Centro - São Paulo/SP - CEP: 01234567"
 
         self.assertEqual(endereco.endereco_completo, endereco_esperado)
@@ -62,32 +78,11 @@ class TestEnderecoModel(TestCase):
         """
         Testa endereco_completo com complemento
         """
-        self.endereco_data["complemento"] = "Apt 45"
-        endereco = Endereco.objects.create(**self.endereco_data)
+        endereco = Endereco.objects.create(**{**ENDERECO_DEFAULTS, "complemento": "Apt 45"})
         endereco_esperado = "Rua das Flores, 123, Apt 45 - Centro - São Paulo/SP - CEP: 01234567"
 
         self.assertEqual(endereco.endereco_completo, endereco_esperado)
 
-    def test_validacao_cep_formato_invalido(self):
-        """
-        Testa validação de CEP com formato inválido
-        """
-        self.endereco_data["cep"] = "123"  # CEP muito curto
-
-        with self.assertRaises(ValidationError):
-            endereco = Endereco(**self.endereco_data)
-            endereco.full_clean()
-
-    def test_validacao_estado_invalido(self):
-        """
-        Testa validação de estado inválido
-        """
-        self.endereco_data["estado"] = "XX"  # Estado não existe
-
-        endereco = Endereco(**self.endereco_data)
-        with self.assertRaises(ValidationError):
-            endereco.full_clean()
-
     def test_campos_obrigatorios(self):
         """
         Testa campos obrigatórios do endereço
@@ -95,52 +90,38 @@ class TestEnderecoModel(TestCase):
         campos_obrigatorios = ["logradouro", "numero", "bairro", "cidade", "estado", "cep"]
 
         for campo in campos_obrigatorios:
-            endereco_data_incompleto = self.endereco_data.copy()
-            del endereco_data_incompleto[campo]
+            with self.subTest(campo=campo):
+                endereco_data_incompleto = {chave: valor for chave, valor in ENDERECO_DEFAULTS.items() if chave != campo}
 
-            with self.assertRaises(ValidationError):
                 endereco = Endereco(**endereco_data_incompleto)
-                endereco.full_clean()
+                with self.assertRaises(ValidationError):
+                    endereco.full_clean()
 
     def test_str_representation(self):
         """
         Testa representação string do modelo
         """
-        endereco = Endereco.objects.create(**self.endereco_data)
+        endereco = Endereco.objects.create(**ENDERECO_DEFAULTS)
         expected_str = "Rua das Flores, 123 - Centro - São Paulo/SP"
 
         self.assertEqual(str(endereco), expected_str)
 
 
-@pytest.mark.django_db
 @pytest.mark.models
 class TestProfissionalModel(TestCase):
     """
     Testes para o modelo Profissional
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Configuração inicial para os testes
+        Dados compartilhados entre os testes da classe (criados uma única vez)
         """
         # Criar endereço para usar nos testes
-        self.endereco = Endereco.objects.create(
-            logradouro="Rua das Flores", numero="123", bairro="Centro", cidade="São Paulo", estado="SP", cep="01234567"
-        )
+        cls.endereco = Endereco.objects.create(**ENDERECO_DEFAULTS)
 
-        self.profissional_data = {
-            "nome_social": "Dr. João Silva",
-            "nome_registro": "João Silva Santos",
-            "profissao": "MEDICO",
-            "registro_profissional": "CRM123456",
-            "especialidade": "Cardiologia",
-            "email": "joao.silva@email.com",
-            "telefone": "11987654321",
-            "endereco": self.endereco,
-            "biografia": "Médico especialista em cardiologia com 10 anos de experiência.",
-            "aceita_convenio": True,
-            "valor_consulta": Decimal("150.00"),
-        }
+        cls.profissional_data = {**PROFISSIONAL_DEFAULTS, "endereco": cls.endereco}
 
     def test_criar_profissional_valido(self):
         """
@@ -151,7 +132,7 @@ class TestProfissionalModel(TestCase):
         self.assertEqual(profissional.nome_social, "Dr. João Silva")
         self.assertEqual(profissional.profissao, "MEDICO")
         self.assertEqual(profissional.email, "joao.silva@email.com")
-        self.assertEqual(profissional.valor_consulta, Decimal("150.00"))
+        self.assertEqual(profissional.valor_consulta, VALOR_CONSULTA_DEFAULT)
         self.assertTrue(profissional.aceita_convenio)
         self.assertTrue(profissional.is_active)
         self.assertIsNotNone(profissional.id)
@@ -176,73 +157,36 @@ class TestProfissionalModel(TestCase):
         profissional = Profissional.objects.create(**self.profissional_data)
         contato_esperado = "📧 joao.silva@email.com | 📞 11987654321"
 
-        self.assertEqual(profissional.get_contato_formatado(), contato_esperado)
+        # Formatação usa apenas campos próprios, sem consultar relacionamentos
+        with self.assertNumQueries(0):
+            contato = profissional.get_contato_formatado()
+
+        self.assertEqual(contato, contato_esperado)
 
     def test_get_contato_formatado_com_whatsapp(self):
         """
         Testa get_contato_formatado com WhatsApp
         """
-        self.profissional_data["whatsapp"] = "11999888777"
-        profissional = Profissional.objects.create(**self.profissional_data)
+        profissional = Profissional.objects.create(**{**self.profissional_data, "whatsapp": "11999888777"})
         contato_esperado = "📧 joao.silva@email.com | 📞 11987654321 | 📱 11999888777"
 
-        self.assertEqual(profissional.get_contato_formatado(), contato_esperado)
-
-    def test_email_unico(self):
-        """
-        Testa que email deve ser único
-        """
-        Profissional.objects.create(**self.profissional_data)
-
-        # Tentar criar outro profissional com mesmo email
-        profissional_data_2 = self.profissional_data.copy()
-        profissional_data_2["nome_social"] = "Dr. Maria"
-
-        with self.assertRaises(IntegrityError):
-            Profissional.objects.create(**profissional_data_2)
-
-    def test_validacao_email_formato(self):
-        """
-        Testa validação de formato de email
-        """
-        self.profissional_data["email"] = "email_invalido"
-
-        with self.assertRaises(ValidationError):
-            profissional = Profissional(**self.profissional_data)
-            profissional.full_clean()
-
-    def test_validacao_valor_consulta_negativo(self):
-        """
-        Testa que valor_consulta não pode ser negativo
-        """
-        self.profissional_data["valor_consulta"] = Decimal("-10.00")
+        # Formatação usa apenas campos próprios, sem consultar relacionamentos
+        with self.assertNumQueries(0):
+            contato = profissional.get_contato_formatado()
 
-        with self.assertRaises(ValidationError):
-            profissional = Profissional(**self.profissional_data)
-            profissional.full_clean()
+        self.assertEqual(contato, contato_esperado)
 
     def test_choices_profissao(self):
         """
         Testa as choices de profissão
         """
-        profissoes_validas = ["MEDICO", "PSICOLOGO", "NUTRICIONISTA", "FISIOTERAPEUTA", "ENFERMEIRO"]
-
-        for profissao in profissoes_validas:
-            self.profissional_data["profissao"] = profissao
-            profissional = Profissional(**self.profissional_data)
-
-            # Não deve gerar erro de validação
-            profissional.full_clean()
+        profissoes_validas = {"MEDICO", "PSICOLOGO", "NUTRICIONISTA", "FISIOTERAPEUTA", "ENFERMEIRO"}
+        choices = frozenset(valor for valor, _ in Profissional._meta.get_field("profissao").choices)
 
-    def test_profissao_invalida(self):
-        """
-        Testa profissão inválida
-        """
-        self.profissional_data["profissao"] = "PROFISSAO_INEXISTENTE"
+        self.assertLessEqual(profissoes_validas, choices)
 
-        with self.assertRaises(ValidationError):
-            profissional = Profissional(**self.profissional_data)
-            profissional.full_clean()
+        # Caso padrão passa pela validação completa do modelo
+        Profissional(**self.profissional_data).full_clean()
 
     def test_campos_opcionais(self):
         """
@@ -257,23 +201,24 @@ class TestProfissionalModel(TestCase):
             "valor_consulta",
         ]
 
+        # Dados mínimos montados uma única vez, fora do loop
+        profissional_data = {
+            "nome_social": "Dr. Test",
+            "profissao": "MEDICO",
+            "telefone": "11987654321",
+            "endereco_id": self.endereco.pk,
+        }
+
         for campo in campos_opcionais:
-            profissional_data = {
-                "nome_social": "Dr. Test",
-                "profissao": "MEDICO",
-                "email": f"test_{campo}@email.com",
-                "telefone": "11987654321",
-                "endereco": self.endereco,
-            }
-
-            # Campo opcional pode ser None/vazio
-            if campo == "valor_consulta":
-                profissional_data[campo] = None
-            else:
-                profissional_data[campo] = ""
-
-            profissional = Profissional(**profissional_data)
-            profissional.full_clean()  # Não deve gerar erro
+            with self.subTest(campo=campo):
+                # Campo opcional pode ser None/vazio
+                valor = None if campo == "valor_consulta" else ""
+
+                profissional = Profissional(**{**profissional_data, "email": f"test_{campo}@email.com", campo: valor})
+
+                # Só os validadores de campo estão em teste: pula FK, unicidade e constraints no banco
+                with self.assertNumQueries(0):
+                    profissional.full_clean(exclude=["endereco"], validate_unique=False, validate_constraints=False)
 
     def test_str_representation(self):
         """
@@ -300,8 +245,7 @@ class TestProfissionalModel(TestCase):
         self.assertFalse(profissional_db.is_active)
 
         # Mas não aparece em queries do manager padrão (se implementado)
-        profissionais_ativos = Profissional.objects.filter(is_active=True)
-        self.assertNotIn(profissional, profissionais_ativos)
+        self.assertQuerySetEqual(Profissional.objects.filter(is_active=True).values_list("pk", flat=True), [], ordered=False)
 
     def test_relacionamento_com_endereco(self):
         """
@@ -312,34 +256,150 @@ class TestProfissionalModel(TestCase):
         self.assertEqual(profissional.endereco, self.endereco)
         self.assertEqual(profissional.endereco.cidade, "São Paulo")
 
-    def test_metodos_business_logic(self):
+    @pytest.mark.skipif(not hasattr(Profissional, "is_disponivel"), reason="is_disponivel não implementado")
+    def test_is_disponivel(self):
         """
-        Testa métodos de lógica de negócio (se existirem)
+        Testa método para verificar disponibilidade
         """
         profissional = Profissional.objects.create(**self.profissional_data)
 
-        # Testa se tem método para verificar disponibilidade
-        if hasattr(profissional, "is_disponivel"):
-            self.assertTrue(profissional.is_disponivel())
+        self.assertTrue(profissional.is_disponivel())
+
+    @pytest.mark.skipif(
+        not hasattr(Profissional, "calcular_valor_com_desconto"), reason="calcular_valor_com_desconto não implementado"
+    )
+    def test_calcular_valor_com_desconto(self):
+        """
+        Testa método para cálculo de valor com desconto
+        """
+        profissional = Profissional(**self.profissional_data)
+
+        self.assertEqual(profissional.calcular_valor_com_desconto(10), VALOR_CONSULTA_COM_DESCONTO)
+
+
+@pytest.mark.models
+class TestProfissionalValidation:
+    """
+    Testes de validação de modelos que não acessam o banco de dados
+    """
+
+    @pytest.fixture(autouse=True)
+    def enable_db_access_for_all_tests(self):
+        """
+        Sobrescreve a fixture global: qualquer acesso ao banco nestes testes é um erro
+        """
+
+    @staticmethod
+    def _full_clean_sem_banco(instancia):
+        """
+        Executa full_clean sem as verificações que consultam o banco (FK, unicidade e constraints)
+        """
+        instancia.full_clean(exclude=["endereco"], validate_unique=False, validate_constraints=False)
+
+    @staticmethod
+    def _profissional(**campos):
+        """
+        Cria um Profissional válido não salvo, com endereço também não salvo
+        """
+        return Profissional(**{**PROFISSIONAL_DEFAULTS, "endereco": Endereco(**ENDERECO_DEFAULTS), **campos})
+
+    def test_validacao_cep_formato_invalido(self):
+        """
+        Testa validação de CEP com formato inválido
+        """
+        endereco = Endereco(**{**ENDERECO_DEFAULTS, "cep": "123"})  # CEP muito curto
+
+        with pytest.raises(ValidationError) as exc_info:
+            self._full_clean_sem_banco(endereco)
+
+        assert "cep" in exc_info.value.message_dict
+
+    def test_validacao_estado_invalido(self):
+        """
+        Testa validação de estado inválido
+        """
+        endereco = Endereco(**{**ENDERECO_DEFAULTS, "estado": "XX"})  # Estado não existe
+
+        with pytest.raises(ValidationError) as exc_info:
+            self._full_clean_sem_banco(endereco)
+
+        assert "estado" in exc_info.value.message_dict
+
+    def test_validacao_email_formato(self):
+        """
+        Testa validação de formato de email
+        """
+        profissional = self._profissional(email="email_invalido")
+
+        with pytest.raises(ValidationError) as exc_info:
+            self._full_clean_sem_banco(profissional)
+
+        assert "email" in exc_info.value.message_dict
+
+    def test_validacao_valor_consulta_negativo(self):
+        """
+        Testa que valor_consulta não pode ser negativo
+        """
+        profissional = self._profissional(valor_consulta=Decimal("-10.00"))
+
+        with pytest.raises(ValidationError) as exc_info:
+            self._full_clean_sem_banco(profissional)
+
+        assert "valor_consulta" in exc_info.value.message_dict
+
+    def test_profissao_invalida(self):
+        """
+        Testa profissão inválida
+        """
+        profissional = self._profissional(profissao="PROFISSAO_INEXISTENTE")
+
+        with pytest.raises(ValidationError) as exc_info:
+            self._full_clean_sem_banco(profissional)
 
-        # Testa método para cálculo de valor com desconto (se existir)
-        if hasattr(profissional, "calcular_valor_com_desconto"):
-            valor_com_desconto = profissional.calcular_valor_com_desconto(10)
-            self.assertEqual(valor_com_desconto, Decimal("135.00"))
+        assert "profissao" in exc_info.value.message_dict
+
+
+@pytest.mark.models
+class TestProfissionalEmailUnico(TestCase):
+    """
+    Testes da restrição de email único no banco (sem full_clean)
+    """
+
+    def test_email_unico(self):
+        """
+        Testa que email deve ser único
+        """
+        # Apenas os campos necessários para a restrição: email e FK de endereço
+        endereco = Endereco.objects.create(**ENDERECO_DEFAULTS)
+        Profissional.objects.create(email="joao.silva@email.com", endereco=endereco)
+
+        # Savepoint para que o IntegrityError não invalide a transação do teste (PostgreSQL)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Profissional.objects.create(email="joao.silva@email.com", endereco=endereco)
+
+    def test_email_unico_case_insensitive(self):
+        """
+        Testa que a unicidade do email ignora maiúsculas/minúsculas (índice em Lower("email"))
+        """
+        endereco = Endereco.objects.create(**ENDERECO_DEFAULTS)
+        Profissional.objects.create(email="Joao.Silva@Email.com", endereco=endereco)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Profissional.objects.create(email="joao.silva@email.com", endereco=endereco)
 
 
-@pytest.mark.django_db
 @pytest.mark.models
 class TestProfissionalQueryset(TestCase):
     """
     Testes para queryset customizado do Profissional (se existir)
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Configurar dados de teste
+        Dados compartilhados entre os testes da classe (criados uma única vez)
         """
-        self.endereco = Endereco.objects.create(
+        cls.endereco = Endereco.objects.create(
             logradouro="Rua Teste", numero="100", bairro="Teste", cidade="São Paulo", estado="SP", cep="12345678"
         )
 
@@ -347,52 +407,70 @@ class TestProfissionalQueryset(TestCase):
         """
         Testa filtro por profissão
         """
-        # Criar profissionais de diferentes profissões
-        Profissional.objects.create(
-            nome_social="Dr. João", profissao="MEDICO", email="joao@test.com", telefone="11111111111", endereco=self.endereco
+        # Criar profissionais de diferentes profissões em um único INSERT
+        Profissional.objects.bulk_create(
+            [
+                Profissional(
+                    nome_social="Dr. João",
+                    profissao="MEDICO",
+                    email="joao@test.com",
+                    telefone="11111111111",
+                    endereco=self.endereco,
+                ),
+                Profissional(
+                    nome_social="Dra. Maria",
+                    profissao="PSICOLOGO",
+                    email="maria@test.com",
+                    telefone="11111111112",
+                    endereco=self.endereco,
+                ),
+            ]
         )
 
-        Profissional.objects.create(
-            nome_social="Dra. Maria",
-            profissao="PSICOLOGO",
-            email="maria@test.com",
-            telefone="11111111112",
-            endereco=self.endereco,
-        )
+        # Endereço carregado no mesmo SELECT (sem N+1)
+        with self.assertNumQueries(1):
+            medicos = list(Profissional.objects.select_related("endereco").filter(profissao="MEDICO"))
+            self.assertEqual([medico.endereco.cidade for medico in medicos], ["São Paulo"])
 
-        medicos = Profissional.objects.filter(profissao="MEDICO")
         psicologos = Profissional.objects.filter(profissao="PSICOLOGO")
 
-        self.assertEqual(medicos.count(), 1)
+        self.assertEqual(len(medicos), 1)
         self.assertEqual(psicologos.count(), 1)
-        self.assertEqual(medicos.first().nome_social, "Dr. João")
+        self.assertEqual(medicos[0].nome_social, "Dr. João")
 
     def test_filtrar_ativos(self):
         """
         Testa filtro por profissionais ativos
         """
-        # Criar profissional ativo
-        prof_ativo = Profissional.objects.create(
-            nome_social="Dr. Ativo",
-            profissao="MEDICO",
-            email="ativo@test.com",
-            telefone="11111111111",
-            endereco=self.endereco,
-            is_active=True,
+        # Criar profissional ativo e inativo em um único INSERT
+        prof_ativo, prof_inativo = Profissional.objects.bulk_create(
+            [
+                Profissional(
+                    nome_social="Dr. Ativo",
+                    profissao="MEDICO",
+                    email="ativo@test.com",
+                    telefone="11111111111",
+                    endereco=self.endereco,
+                    is_active=True,
+                ),
+                Profissional(
+                    nome_social="Dr. Inativo",
+                    profissao="MEDICO",
+                    email="inativo@test.com",
+                    telefone="11111111112",
+                    endereco=self.endereco,
+                    is_active=False,
+                ),
+            ]
         )
 
-        # Criar profissional inativo
-        prof_inativo = Profissional.objects.create(
-            nome_social="Dr. Inativo",
-            profissao="MEDICO",
-            email="inativo@test.com",
-            telefone="11111111112",
-            endereco=self.endereco,
-            is_active=False,
-        )
-
-        ativos = Profissional.objects.filter(is_active=True)
+        # Endereço carregado no mesmo SELECT (sem N+1)
+        with self.assertNumQueries(1):
+            ativos = list(Profissional.objects.select_related("endereco").filter(is_active=True))
+            self.assertEqual([profissional.endereco.cidade for profissional in ativos], ["São Paulo"])
 
-        self.assertEqual(ativos.count(), 1)
-        self.assertIn(prof_ativo, ativos)
-        self.assertNotIn(prof_inativo, ativos)
+        # Compara apenas os pks, sem instanciar os modelos
+        self.assertQuerySetEqual(
+            Profissional.objects.filter(is_active=True).values_list("pk", flat=True), [prof_ativo.pk], ordered=False
+        )
+        self.assertFalse(Profissional.objects.filter(is_active=True, pk=prof_inativo.pk).exists())
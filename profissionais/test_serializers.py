@@ -27,9 +27,18 @@ class TestEnderecoSerializer(TestCase):
     Testes para EnderecoSerializer
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Endereço compartilhado entre os testes da classe (criado uma única vez)
+        """
+        cls.endereco = Endereco.objects.create(
+            logradouro="Rua das Flores", numero="123", bairro="Centro", cidade="São Paulo", estado="SP", cep="01234567"
+        )
+
     def setUp(self):
         """
-        Configuração inicial para os testes
+        Payload por teste, pois alguns testes o alteram
         """
         self.endereco_data = {
             "logradouro": "Rua das Flores",
@@ -40,8 +49,6 @@ class TestEnderecoSerializer(TestCase):
             "cep": "01234567",
         }
 
-        self.endereco = Endereco.objects.create(**self.endereco_data)
-
     def test_serialization_endereco_valido(self):
         """
         Testa serialização de endereço válido
@@ -148,9 +155,26 @@ class TestProfissionalSerializer(TestCase):
     Testes para ProfissionalSerializer
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Profissional compartilhado entre os testes da classe (criado uma única vez)
+        """
+        cls.endereco = Endereco.objects.create(
+            logradouro="Rua das Flores", numero="123", bairro="Centro", cidade="São Paulo", estado="SP", cep="01234567"
+        )
+        cls.profissional = Profissional.objects.create(
+            nome_social="Dr. João Silva",
+            profissao="MEDICO",
+            email="joao.silva@email.com",
+            telefone="11987654321",
+            endereco=cls.endereco,
+            valor_consulta=Decimal("150.00"),
+        )
+
     def setUp(self):
         """
-        Configuração inicial para os testes
+        Payloads por teste, pois alguns testes os alteram
         """
         self.endereco_data = {
             "logradouro": "Rua das Flores",
@@ -175,17 +199,6 @@ class TestProfissionalSerializer(TestCase):
             "valor_consulta": "150.00",
         }
 
-        # Criar profissional para testes de serialização
-        self.endereco = Endereco.objects.create(**self.endereco_data)
-        self.profissional = Profissional.objects.create(
-            nome_social="Dr. João Silva",
-            profissao="MEDICO",
-            email="joao.silva@email.com",
-            telefone="11987654321",
-            endereco=self.endereco,
-            valor_consulta=Decimal("150.00"),
-        )
-
     def test_serialization_profissional_completo(self):
         """
         Testa serialização de profissional com todos os campos
@@ -232,11 +245,16 @@ class TestProfissionalSerializer(TestCase):
         """
         # Usar email já existente
         self.profissional_data["email"] = "joao.silva@email.com"  # Mesmo email do profissional criado no setUp
+        self.profissional_data["nome_social"] = "João Silva"
+        self.profissional_data["registro_profissional"] = "123456"
 
         serializer = ProfissionalSerializer(data=self.profissional_data)
 
-        self.assertFalse(serializer.is_valid())
-        self.assertIn("email", serializer.errors)
+        # A unicidade é garantida pela constraint do banco, verificada no save()
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with self.assertRaises(serializers.ValidationError) as context:
+            serializer.save()
+        self.assertIn("email", context.exception.detail)
 
     def test_validacao_email_formato_invalido(self):
         """
@@ -359,20 +377,21 @@ class TestProfissionalSerializerVariants(TestCase):
     Testes para variantes do ProfissionalSerializer
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Configuração inicial
+        Profissional compartilhado entre os testes da classe (criado uma única vez)
         """
-        self.endereco = Endereco.objects.create(
+        cls.endereco = Endereco.objects.create(
             logradouro="Rua Teste", numero="100", bairro="Teste", cidade="São Paulo", estado="SP", cep="12345678"
         )
 
-        self.profissional = Profissional.objects.create(
+        cls.profissional = Profissional.objects.create(
             nome_social="Dr. Teste",
             profissao="MEDICO",
             email="teste@email.com",
             telefone="11987654321",
-            endereco=self.endereco,
+            endereco=cls.endereco,
             valor_consulta=Decimal("150.00"),
         )
 
@@ -463,18 +482,15 @@ class TestSerializerValidacoes(TestCase):
     Testes para validações customizadas nos serializers
     """
 
-    def setUp(self):
-        """
-        Configuração inicial
-        """
-        self.endereco_data = {
-            "logradouro": "Rua Teste",
-            "numero": "100",
-            "bairro": "Teste",
-            "cidade": "São Paulo",
-            "estado": "SP",
-            "cep": "12345678",
-        }
+    # Payload de endereço somente leitura, compartilhado pelos testes
+    endereco_data = {
+        "logradouro": "Rua Teste",
+        "numero": "100",
+        "bairro": "Teste",
+        "cidade": "São Paulo",
+        "estado": "SP",
+        "cep": "12345678",
+    }
 
     def test_sanitizacao_nome_social(self):
         """
@@ -3,15 +3,24 @@ Views para Profissionais - Lacrei Saúde API
 ===========================================
 """
 
-from django_filters.rest_framework import DjangoFilterBackend
+import hashlib
+import uuid
+from datetime import date
+
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from django.db.models import Q
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, patch_vary_headers
 
 from authentication.permissions import IsOwnerOrAdmin, IsProfissionalOrAdmin, ReadOnlyOrOwner
+from consultas.serializers import ConsultaListSerializer
+from lacrei_saude.filters import LazyDjangoFilterBackend
 from lacrei_saude.pagination import StandardResultsSetPagination
 
 from .filters import ProfissionalFilter
@@ -23,25 +32,74 @@ from .serializers import (
     ProfissionalSerializer,
 )
 
+# Rótulos de exibição das profissões, montados uma única vez por processo
+_PROFISSAO_DISPLAY = dict(Profissional._meta.get_field("profissao").choices)
+
+# Chave e validade (segundos) do cache das estatísticas sem filtros
+_ESTATISTICAS_CACHE_KEY = "profissional_stats_v1"
+_ESTATISTICAS_CACHE_TIMEOUT = 60
+
+# Cache da listagem: as chaves incluem a versão atual, trocada a cada escrita de profissional.
+# O retrieve não é memoizado, pois seus contadores de consultas mudam sem passar por esta view.
+# A versão precisa de um backend de cache compartilhado (Redis/Memcached) com mais de um worker:
+# no LocMemCache cada processo invalida apenas as próprias entradas.
+_VERSAO_CACHE_KEY = "profissional_cache_versao"
+_LEITURA_CACHE_PREFIX = "profissional_leitura"
+_LEITURA_CACHE_TIMEOUT = 60
+
+# Ações somente leitura que recebem Cache-Control/Vary na resposta
+_ACOES_CACHEAVEIS = frozenset({"list", "retrieve", "estatisticas", "agenda"})
+
+# Colunas lidas por ProfissionalListSerializer (inclusive cidade/estado do endereço)
+_CAMPOS_LISTAGEM = (
+    "id",
+    "nome_social",
+    "profissao",
+    "especialidade",
+    "email",
+    "telefone",
+    "aceita_convenio",
+    "valor_consulta",
+    "endereco__cidade",
+    "endereco__estado",
+)
+
+# Limite de consultas futuras contadas ao bloquear a desativação
+_LIMITE_CONSULTAS_FUTURAS = 50
+
+
+def _versao_cache():
+    """
+    Retorna a versão atual do cache de leituras de profissionais
+    """
+    return cache.get_or_set(_VERSAO_CACHE_KEY, lambda: uuid.uuid4().hex, None)
+
+
+def _invalidar_cache():
+    """
+    Troca a versão do cache, descartando todas as leituras memoizadas de profissionais
+    """
+    cache.set(_VERSAO_CACHE_KEY, uuid.uuid4().hex, None)
+
 
 class ProfissionalViewSet(viewsets.ModelViewSet):
     """
     ViewSet para operações CRUD de Profissionais
     """
 
-    queryset = Profissional.objects.filter(is_active=True)
+    queryset = Profissional.objects.filter(is_active=True).select_related("endereco")
     permission_classes = [IsAuthenticated, ReadOnlyOrOwner]
     pagination_class = StandardResultsSetPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [LazyDjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
 
     # Usar filtro personalizado
     filterset_class = ProfissionalFilter
 
     # Campos para busca
-    search_fields = ["nome_social", "nome_registro", "especialidade", "endereco__cidade", "endereco__bairro"]
+    search_fields = ("nome_social", "nome_registro", "especialidade", "endereco__cidade", "endereco__bairro")
 
     # Campos para ordenação
-    ordering_fields = [
+    ordering_fields = (
         "nome_social",
         "profissao",
         "created_at",
@@ -49,9 +107,28 @@ class ProfissionalViewSet(viewsets.ModelViewSet):
         "especialidade",
         "endereco__cidade",
         "endereco__estado",
-    ]
+    )
     ordering = ["nome_social"]
 
+    # Parâmetros opcionais de get_queryset, interpretados uma única vez em initial()
+    _disponivel = False
+    _valor_max = None
+
+    def initial(self, request, *args, **kwargs):
+        """
+        Interpreta os parâmetros opcionais de filtro antes do processamento da requisição
+        """
+        self._disponivel = request.query_params.get("disponivel") == "true"
+
+        self._valor_max = None
+        if valor_max := request.query_params.get("valor_max"):
+            try:
+                self._valor_max = float(valor_max)
+            except ValueError:
+                pass
+
+        super().initial(request, *args, **kwargs)
+
     def get_serializer_class(self):
         """
         Retorna serializer apropriado baseado na ação
@@ -69,23 +146,57 @@ class ProfissionalViewSet(viewsets.ModelViewSet):
         Filtrar queryset baseado em parâmetros opcionais
         """
         queryset = super().get_queryset()
+        filtros = Q()
+
+        # A listagem só precisa das colunas do serializer resumido
+        if self.action == "list":
+            queryset = queryset.only(*_CAMPOS_LISTAGEM)
 
-        # Filtro por disponibilidade para consulta
-        disponivel = self.request.query_params.get("disponivel", None)
-        if disponivel == "true":
-            # Filtrar profissionais ativos que aceitam consultas
-            queryset = queryset.filter(is_active=True)
+        # Filtro por disponibilidade para consulta (profissionais ativos que aceitam consultas)
+        if self._disponivel:
+            filtros &= Q(is_active=True)
 
         # Filtro por valor máximo de consulta
-        valor_max = self.request.query_params.get("valor_max", None)
-        if valor_max:
-            try:
-                valor_max = float(valor_max)
-                queryset = queryset.filter(Q(valor_consulta__lte=valor_max) | Q(valor_consulta__isnull=True))
-            except ValueError:
-                pass
+        if self._valor_max is not None:
+            filtros &= Q(valor_consulta__lte=self._valor_max) | Q(valor_consulta__isnull=True)
 
-        return queryset
+        # Um único filter() para todos os critérios
+        return queryset.filter(filtros) if filtros else queryset
+
+    def list(self, request, *args, **kwargs):
+        """
+        Listagem memoizada por URL absoluta (host, filtros, busca, ordenação e página)
+
+        A chave é deliberadamente independente do usuário: a leitura é igual para qualquer autenticado
+        e get_queryset() não depende do usuário. O host entra na chave porque os links next/previous
+        da paginação são absolutos.
+
+        Só as escritas feitas por este ViewSet (create/update/destroy, desativar e reativar) trocam a
+        versão do cache. Alterações pelo Django admin, pelo shell ou diretamente pelo ORM podem deixar
+        a listagem desatualizada por até _LEITURA_CACHE_TIMEOUT segundos.
+        """
+        url_hash = hashlib.md5(request.build_absolute_uri().encode(), usedforsecurity=False).hexdigest()
+        chave = f"{_LEITURA_CACHE_PREFIX}:{_versao_cache()}:{url_hash}"
+
+        dados = cache.get(chave)
+        if dados is not None:
+            return Response(dados)
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(chave, response.data, _LEITURA_CACHE_TIMEOUT)
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Permite cache privado de curta duração nas leituras bem-sucedidas
+        """
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.action in _ACOES_CACHEAVEIS and response.status_code == status.HTTP_200_OK:
+            # Cache-Control/Vary valem para caches do cliente; o cache do servidor (list) não varia por usuário
+            patch_cache_control(response, private=True, max_age=_LEITURA_CACHE_TIMEOUT)
+            patch_vary_headers(response, ["Authorization"])
+        return response
 
     def perform_create(self, serializer):
         """
@@ -93,12 +204,14 @@ class ProfissionalViewSet(viewsets.ModelViewSet):
         """
         # Adicionar informações do usuário se necessário
         serializer.save()
+        _invalidar_cache()
 
     def perform_update(self, serializer):
         """
         Personalizar atualização do profissional
         """
         serializer.save()
+        _invalidar_cache()
 
     def perform_destroy(self, instance):
         """
@@ -106,6 +219,7 @@ class ProfissionalViewSet(viewsets.ModelViewSet):
         """
         instance.is_active = False
         instance.save()
+        _invalidar_cache()
 
     @action(detail=True, methods=["get"])
     def consultas(self, request, pk=None):
@@ -129,8 +243,6 @@ class ProfissionalViewSet(viewsets.ModelViewSet):
             consultas = consultas.filter(data_hora__date__lte=data_fim)
 
         # Serializar consultas
-        from consultas.serializers import ConsultaListSerializer
-
         serializer = ConsultaListSerializer(consultas, many=True)
 
         return Response(serializer.data)
@@ -149,9 +261,7 @@ class ProfissionalViewSet(viewsets.ModelViewSet):
             )
 
         try:
-            from datetime import datetime
-
-            data_consulta = datetime.strptime(data, "%Y-%m-%d").date()
+            data_consulta = date.fromisoformat(data)
         except ValueError:
             return Response({"error": "Formato de data inválido. Use YYYY-MM-DD"}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -161,17 +271,17 @@ class ProfissionalViewSet(viewsets.ModelViewSet):
         ).order_by("data_hora")
 
         # Serializar consultas agendadas
-        from consultas.serializers import ConsultaListSerializer
-
-        consultas_serializer = ConsultaListSerializer(consultas_agendadas, many=True)
+        consultas_agendadas_data = ConsultaListSerializer(consultas_agendadas, many=True).data
 
-        return Response(
+        # Payload já em tipos nativos: JsonResponse dispensa a negociação de conteúdo e o renderer do DRF
+        return JsonResponse(
             {
                 "profissional": profissional.nome_social,
                 "data": data,
-                "consultas_agendadas": consultas_serializer.data,
-                "total_consultas": consultas_agendadas.count(),
-            }
+                "consultas_agendadas": consultas_agendadas_data,
+                "total_consultas": len(consultas_agendadas_data),
+            },
+            json_dumps_params={"ensure_ascii": False},
         )
 
     @action(detail=True, methods=["post"])
@@ -182,23 +292,26 @@ class ProfissionalViewSet(viewsets.ModelViewSet):
         profissional = self.get_object()
 
         # Verificar se há consultas futuras
-        from django.utils import timezone
-
         consultas_futuras = profissional.consultas.filter(
             data_hora__gt=timezone.now(), status__in=["AGENDADA", "CONFIRMADA"], is_active=True
         )
 
-        if consultas_futuras.exists():
+        # Um único COUNT limitado atende a verificação e a mensagem de erro sem varrer todas as consultas
+        total_consultas_futuras = consultas_futuras[: _LIMITE_CONSULTAS_FUTURAS + 1].count()
+        if total_consultas_futuras:
+            if total_consultas_futuras > _LIMITE_CONSULTAS_FUTURAS:
+                total_consultas_futuras = f"{_LIMITE_CONSULTAS_FUTURAS}+"
             return Response(
                 {
                     "error": "Não é possível desativar profissional com consultas futuras agendadas",
-                    "consultas_futuras": consultas_futuras.count(),
+                    "consultas_futuras": total_consultas_futuras,
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
         profissional.is_active = False
         profissional.save()
+        _invalidar_cache()
 
         return Response({"message": "Profissional desativado com sucesso"}, status=status.HTTP_200_OK)
 
@@ -210,6 +323,7 @@ class ProfissionalViewSet(viewsets.ModelViewSet):
         profissional = self.get_object()
         profissional.is_active = True
         profissional.save()
+        _invalidar_cache()
 
         return Response({"message": "Profissional reativado com sucesso"}, status=status.HTTP_200_OK)
 
@@ -218,32 +332,39 @@ class ProfissionalViewSet(viewsets.ModelViewSet):
         """
         Estatísticas gerais dos profissionais
         """
+        # Estatísticas não dependem do usuário; só a versão sem filtros é memoizada
+        if self._disponivel or self._valor_max is not None:
+            return Response(self._calcular_estatisticas())
+
+        chave = f"{_ESTATISTICAS_CACHE_KEY}:{_versao_cache()}"
+        return Response(cache.get_or_set(chave, self._calcular_estatisticas, _ESTATISTICAS_CACHE_TIMEOUT))
+
+    def _calcular_estatisticas(self):
+        """
+        Calcula as estatísticas em duas queries: totais gerais e agrupamento por profissão
+        """
         queryset = self.get_queryset()
 
-        stats = {
-            "total_profissionais": queryset.count(),
-            "profissionais_ativos": queryset.filter(is_active=True).count(),
-            "por_profissao": {},
-            "aceita_convenio": queryset.filter(aceita_convenio=True).count(),
-            "valor_medio_consulta": 0,
-        }
+        totais = queryset.aggregate(
+            total=Count("id"),
+            ativos=Count("id", filter=Q(is_active=True)),
+            com_convenio=Count("id", filter=Q(aceita_convenio=True)),
+            valor_medio=Avg("valor_consulta"),
+        )
 
         # Estatísticas por profissão
-        from django.db.models import Avg, Count
-
         profissoes_stats = queryset.values("profissao").annotate(total=Count("id"), valor_medio=Avg("valor_consulta"))
 
-        for prof_stat in profissoes_stats:
-            profissao_display = dict(Profissional._meta.get_field("profissao").choices).get(
-                prof_stat["profissao"], prof_stat["profissao"]
-            )
-            stats["por_profissao"][profissao_display] = {
-                "total": prof_stat["total"],
-                "valor_medio": prof_stat["valor_medio"] or 0,
-            }
-
-        # Valor médio geral
-        valor_medio = queryset.aggregate(media=Avg("valor_consulta"))["media"]
-        stats["valor_medio_consulta"] = valor_medio or 0
-
-        return Response(stats)
+        return {
+            "total_profissionais": totais["total"],
+            "profissionais_ativos": totais["ativos"],
+            "por_profissao": {
+                _PROFISSAO_DISPLAY.get(prof_stat["profissao"], prof_stat["profissao"]): {
+                    "total": prof_stat["total"],
+                    "valor_medio": prof_stat["valor_medio"] or 0,
+                }
+                for prof_stat in profissoes_stats
+            },
+            "aceita_convenio": totais["com_convenio"],
+            "valor_medio_consulta": totais["valor_medio"] or 0,
+        }
@@ -0,0 +1,33 @@
+"""
+Factories de teste para Profissionais - Lacrei Saúde API
+========================================================
+"""
+
+import factory
+
+
+class EnderecoPayloadFactory(factory.DictFactory):
+    """
+    Payload (dict) de endereço para requisições à API, sem acessar o banco
+    """
+
+    logradouro = "Rua Teste"
+    numero = "100"
+    bairro = "Centro"
+    cidade = "São Paulo"
+    estado = "SP"
+    cep = "12345678"
+
+
+class ProfissionalPayloadFactory(factory.DictFactory):
+    """
+    Payload (dict) de criação de profissional para requisições à API, sem acessar o banco
+
+    Campos do endereço aninhado podem ser sobrescritos com `endereco__<campo>=...`.
+    """
+
+    nome_social = "Doutora Teste"
+    profissao = "MEDICO"
+    email = factory.Sequence(lambda n: f"profissional{n}@test.com")
+    telefone = "11987654321"
+    endereco = factory.SubFactory(EnderecoPayloadFactory)